@@ -0,0 +1,103 @@
+import os
+import json
+import hashlib
+
+from decimal import Decimal, InvalidOperation
+
+from reports import generate_report_context
+from pdf_utils import get_report_names, get_totalled_reports
+from utils import get_base_path
+
+_period_data_cache = {}
+
+def get_data_fingerprint(period=None):
+    # Locations are always read from week_data, so it is part of every period's fingerprint.
+    data_directories = sorted(set([f"{(period or 'week')}_data", "week_data"]))
+    fingerprint = hashlib.sha1()
+
+    for data_directory in data_directories:
+        directory = os.path.join(get_base_path(), data_directory)
+
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith('.csv'):
+                continue
+
+            stat = os.stat(os.path.join(directory, file_name))
+            fingerprint.update(
+                f"{data_directory}/{file_name}:{stat.st_mtime_ns}:{stat.st_size};".encode('utf-8'))
+
+    return fingerprint.hexdigest()
+
+def to_number(value):
+    if value is None or value == '':
+        return None
+
+    if isinstance(value, int):
+        return value
+
+    try:
+        number = Decimal(value)
+    except (InvalidOperation, ValueError):
+        return value
+
+    return float(number) if number.is_finite() else None
+
+def encode_report_columns(context):
+    rows = context['rows']
+    label_column = context.get('label_column') or 'store'
+    columns = context.get('display_headers')
+
+    if columns is None:
+        columns = [
+            column
+                for column in (rows and rows[0].keys() or [])
+                    if column not in (label_column, 'level')]
+
+    encoded = {
+        'full_report_name': context.get('full_report_name'),
+        'label_column': label_column,
+        'columns': columns,
+        'labels': [row.get(label_column) for row in rows],
+        'levels': [row.get('level') for row in rows],
+        'values': [[to_number(row.get(column)) for row in rows] for column in columns]}
+
+    for key in ('prefix', 'suffix', 'decimal_places', 'grayed_columns'):
+        if key in context:
+            encoded[key] = context[key]
+
+    if context.get('display_header_groupings'):
+        encoded['display_header_groupings'] = [
+            [group_name, group_columns]
+                for (group_name, (group_columns, _)) in context['display_header_groupings'].items()]
+
+    return encoded
+
+def generate_period_data(period=None, fingerprint=None):
+    period = period or 'week'
+    reports = {}
+
+    for report_name in get_report_names():
+        (_, context) = generate_report_context(
+            report_name,
+            period=period,
+            totalled_reports=get_totalled_reports())
+        reports[report_name] = encode_report_columns(context)
+
+    return {
+        'period': period,
+        'fingerprint': fingerprint or get_data_fingerprint(period),
+        'reports': reports}
+
+def get_period_data_json(period=None):
+    period = period or 'week'
+    fingerprint = get_data_fingerprint(period)
+
+    cached = _period_data_cache.get(period)
+    if cached is not None and cached[0] == fingerprint:
+        return cached
+
+    period_data = generate_period_data(period, fingerprint=fingerprint)
+    cached = (fingerprint, json.dumps(period_data, separators=(',', ':')))
+    _period_data_cache[period] = cached
+
+    return cached
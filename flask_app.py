@@ -1,8 +1,9 @@
 
-from flask import Flask, render_template, request, make_response
+from flask import Flask, render_template, request, make_response, abort
 
 from reports import generate_report_context
-from pdf_utils import generate_pdf_reportbook, generate_condensed_pdf
+from pdf_utils import generate_pdf_reportbook, generate_condensed_pdf, get_periods
+from data_api import get_period_data_json
 
 app = Flask(__name__)
 
@@ -40,5 +41,20 @@ def report(report_name=None):
     else:
         return None
 
+@app.route("/data")
+def data():
+    period = request.args.get('period') or 'week'
+
+    if period not in get_periods():
+        abort(404)
+
+    (fingerprint, json_content) = get_period_data_json(period=period)
+    response = make_response(json_content)
+
+    response.headers['Content-Type'] = 'application/json'
+    response.set_etag(fingerprint)
+
+    return response.make_conditional(request)
+
 if __name__ == "__main__":
     app.run()